@@ -48,6 +48,11 @@ Analysis::Analysis(const ROM& rom) : rom{rom} {
   reset();
 }
 
+// Construct an analysis taking ownership of a ROM object.
+Analysis::Analysis(ROM&& rom) : rom{std::move(rom)} {
+  reset();
+}
+
 // Construct an analysis from a ROM path.
 Analysis::Analysis(const std::string& romPath) : Analysis(ROM(romPath)) {}
 
@@ -135,6 +140,20 @@ Instruction* Analysis::addInstruction(InstructionPC pc,
   return instructionPtr;
 }
 
+// Whether an instruction has already been visited with the given state.
+bool Analysis::isVisited(InstructionPC pc,
+                         SubroutinePC subroutinePC,
+                         State state) const {
+  auto search = instructions.find(pc);
+  if (search == instructions.end()) {
+    return false;
+  }
+
+  // Instructions are identified by their coordinates and state only.
+  auto& instructionSet = search->second;
+  return instructionSet.count(Instruction(pc, subroutinePC, 0, 0, state)) != 0;
+}
+
 // Add a reference from an instruction to another.
 void Analysis::addReference(InstructionPC source,
                             InstructionPC target,
@@ -164,6 +183,11 @@ void Analysis::addSubroutine(SubroutinePC pc,
 // Get an assertion for an instruction, if any.
 optional<Assertion> Analysis::getAssertion(InstructionPC pc,
                                            SubroutinePC subroutinePC) const {
+  // Most analyses have no assertions at all: skip hashing the coordinates.
+  if (assertions.empty()) {
+    return nullopt;
+  }
+
   auto search = assertions.find({pc, subroutinePC});
   if (search != assertions.end()) {
     return search->second;
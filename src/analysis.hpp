@@ -63,6 +63,8 @@ class Analysis {
   Analysis();
   // Construct an analysis from a ROM object.
   Analysis(const ROM& rom);
+  // Construct an analysis taking ownership of a ROM object.
+  Analysis(ROM&& rom);
   // Construct an analysis from a ROM path.
   Analysis(const std::string& romPath);
 
@@ -82,6 +84,11 @@ class Analysis {
                               u24 argument,
                               State state);
 
+  // Whether an instruction has already been visited with the given state.
+  bool isVisited(InstructionPC pc,
+                 SubroutinePC subroutinePC,
+                 State state) const;
+
   // Add a reference from an instruction to another.
   void addReference(InstructionPC source,
                     InstructionPC target,
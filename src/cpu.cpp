@@ -29,16 +29,34 @@ CPU::CPU(const CPU& cpu)
       stateInference{cpu.stateInference},
       A{cpu.A},
       X{cpu.X},
-      analysis{cpu.analysis} {
+      analysis{cpu.analysis},
+      worklist{cpu.worklist},
+      caller{cpu.caller} {
   A.cpu = this;
   X.cpu = this;
 }
 
 // Start emulating.
 void CPU::run() {
+  // Parallel instances of the CPU created while emulating are queued here
+  // instead of being run recursively. The most recently queued runs first,
+  // which explores paths in the same order as a depth-first recursion.
+  list<CPU> pending;
+  worklist = &pending;
+
   while (!stop) {
     step();
   }
+
+  while (!pending.empty()) {
+    auto cpu = prev(pending.end());
+    while (!cpu->stop) {
+      cpu->step();
+    }
+    pending.erase(cpu);
+  }
+
+  worklist = nullptr;
 }
 
 // Fetch and execute the next instruction.
@@ -48,8 +66,7 @@ void CPU::step() {
     return unknownStateChange(pc, UnknownReason::MutableCode);
   }
 
-  auto opcode = analysis->rom.readByte(pc);
-  auto argument = analysis->rom.readAddress(pc + 1);
+  auto [opcode, argument] = analysis->rom.readInstruction(pc);
   auto instruction =
       analysis->addInstruction(pc, subroutinePC, opcode, argument, state);
 
@@ -100,16 +117,26 @@ void CPU::execute(const Instruction* instruction) {
 
 // Branch emulation.
 void CPU::branch(const Instruction* instruction) {
-  // Run a parallel instance of the CPU to cover
-  // the case in which the branch is not taken.
-  CPU cpu(*this);
-  cpu.run();
-
   // Log the fact that the current instruction references the
-  // instruction pointed by the branch. Then take the branch.
+  // instruction pointed by the branch.
   auto target = *instruction->absoluteArgument();
   analysis->addReference(instruction->pc, target, subroutinePC);
-  pc = target;
+
+  if (analysis->isVisited(pc, subroutinePC, state)) {
+    // The case in which the branch is not taken was already explored.
+    pc = target;
+  } else if (worklist != nullptr) {
+    // Cover the case in which the branch is not taken first,
+    // and queue a parallel instance of the CPU to take the branch.
+    auto& cpu = worklist->emplace_back(*this);
+    cpu.pc = target;
+  } else {
+    // Not inside run(): cover the case in which the branch is not
+    // taken with a parallel instance of the CPU, then take the branch.
+    CPU cpu(*this);
+    cpu.run();
+    pc = target;
+  }
 }
 
 // Call emulation.
@@ -121,12 +148,20 @@ void CPU::call(const Instruction* instruction) {
   }
 
   for (auto target : *targets) {
+    analysis->addSubroutine(target);
+    analysis->addReference(instruction->pc, target, subroutinePC);
+    // The subroutine has already been explored in this state.
+    if (analysis->isVisited(target, target, state)) {
+      continue;
+    }
+
     // Create a parallel instance of the CPU to
     // execute the subroutine that is being called.
     CPU cpu(*this);
     cpu.pc = target;
     cpu.subroutinePC = target;
     cpu.stateChange = StateChange();
+    cpu.caller = this;
     // Push the return address on the stack.
     switch (instruction->operation()) {
       case Op::JSR:
@@ -140,8 +175,6 @@ void CPU::call(const Instruction* instruction) {
     }
 
     // Emulate the called subroutine.
-    analysis->addSubroutine(target);
-    analysis->addReference(instruction->pc, target, subroutinePC);
     cpu.run();
   }
   // Propagate called subroutines state to caller.
@@ -161,15 +194,27 @@ void CPU::jump(const Instruction* instruction) {
     return unknownStateChange(instruction->pc, UnknownReason::IndirectJump);
   }
 
-  // Execute each target in its own CPU instance.
+  // Execute each target in its own CPU instance. Queued instances run last
+  // in first out, so insert each one before the previous to keep the order.
+  auto position =
+      (worklist != nullptr) ? worklist->end() : list<CPU>::iterator();
   for (auto target : *targets) {
     analysis->addReference(instruction->pc, target, subroutinePC);
-    CPU cpu(*this);
-    cpu.pc = target;
-    cpu.run();
+    if (analysis->isVisited(target, subroutinePC, state)) {
+      continue;
+    }
+
+    if (worklist != nullptr) {
+      position = worklist->emplace(position, *this);
+      position->pc = target;
+    } else {
+      CPU cpu(*this);
+      cpu.pc = target;
+      cpu.run();
+    }
   }
 
-  // Targets have already been executed - stop here.
+  // Targets are executed by their own instances - stop here.
   stop = true;
 }
 
@@ -469,31 +514,58 @@ Subroutine* CPU::subroutine() const {
   return &analysis->subroutines.at(subroutinePC);
 }
 
+// Whether the given subroutine is being executed up the call chain.
+bool CPU::isRecursive(SubroutinePC target) const {
+  for (auto cpu = this; cpu != nullptr; cpu = cpu->caller) {
+    if (cpu->subroutinePC == target) {
+      return true;
+    }
+  }
+  return false;
+}
+
 // Take the state change of the given subroutines and
 // propagate it to to the current subroutine state.
 void CPU::propagateSubroutineState(
     InstructionPC pc,
     const unordered_set<InstructionPC>& targets) {
-  StateChangeSet stateChanges;
+  optional<StateChange> unifiedStateChange;
+  bool ambiguous = false;
 
   // Iterate through all the called subroutines.
   for (auto target : targets) {
     auto& subroutine = analysis->subroutines.at(target);
+    // Recursive call to a subroutine that hasn't returned yet.
+    if (subroutine.knownStateChanges.empty() &&
+        subroutine.unknownStateChanges.empty() && isRecursive(target)) {
+      return unknownStateChange(pc, UnknownReason::Recursion);
+    }
     // Unknown state change.
     if (!subroutine.unknownStateChanges.empty()) {
       return unknownStateChange(pc, UnknownReason::Unknown);
     }
-    // Gather all state changes across subroutines.
-    stateChanges.merge(subroutine.simplifiedStateChanges(state));
+    // Check that all state changes across subroutines agree, once simplified.
+    // Keep looking for unknown state changes even if they don't.
+    for (auto& [changePC, stateChange] : subroutine.knownStateChanges) {
+      if (ambiguous) {
+        break;
+      }
+      auto simplifiedStateChange = stateChange.simplify(state);
+      if (!unifiedStateChange.has_value()) {
+        unifiedStateChange = simplifiedStateChange;
+      } else if (!(*unifiedStateChange == simplifiedStateChange)) {
+        ambiguous = true;
+      }
+    }
   }
 
   // Ambiguous states.
-  if (stateChanges.size() != 1) {
+  if (ambiguous || !unifiedStateChange.has_value()) {
     return unknownStateChange(pc, UnknownReason::MultipleReturnStates);
   }
 
   // Single, valid state change that we can propagate.
-  applyStateChange(*stateChanges.begin());
+  applyStateChange(*unifiedStateChange);
 }
 
 // Signal an unknown subroutine state change.
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <list>
 #include <unordered_set>
 #include <utility>
 #include <vector>
@@ -81,6 +82,9 @@ class CPU {
   // Return a pointer to the current subroutine object.
   Subroutine* subroutine() const;
 
+  // Whether the given subroutine is being executed up the call chain.
+  bool isRecursive(SubroutinePC target) const;
+
   // Take the state change of the given subroutines and
   // propagate it to to the current subroutine state.
   void propagateSubroutineState(
@@ -92,6 +96,10 @@ class CPU {
 
   // Pointer to the analysis.
   Analysis* analysis;
+  // Parallel instances of the CPU waiting to be run by the current run().
+  std::list<CPU>* worklist = nullptr;
+  // The instance that called the current subroutine, if any.
+  const CPU* caller = nullptr;
 
   // Test functions.
   friend void runInstruction(CPU& cpu, u8 opcode, u24 argument);
@@ -1,6 +1,7 @@
 #include <QInputDialog>
 #include <QMenu>
 #include <QScrollBar>
+#include <QSignalBlocker>
 
 #include "gui/disassemblyview.hpp"
 
@@ -19,6 +20,9 @@ using namespace std;
 DisassemblyView::DisassemblyView(QWidget* parent) : QTextEdit(parent) {
   setFontFamily(MONOSPACE_FONT);
   setReadOnly(true);
+  // The document is rebuilt from scratch on every analysis:
+  // don't keep a history of all the insertions.
+  setUndoRedoEnabled(false);
   defaultFormat = textCursor().charFormat();
 
   highlighter = new Highlighter(document());
@@ -45,9 +49,19 @@ void DisassemblyView::reset() {
 void DisassemblyView::renderAnalysis(Analysis* analysis) {
   this->analysis = analysis;
 
-  reset();
-  for (auto& [pc, subroutine] : analysis->subroutines) {
-    renderSubroutine(subroutine);
+  // Every insertion moves the cursor: keep the current line highlighting out
+  // of the rendering loop, and do it only once at the end.
+  {
+    const QSignalBlocker blocker(this);
+    reset();
+
+    // Group all the insertions so the document is laid out only once.
+    QTextCursor cursor(document());
+    cursor.beginEditBlock();
+    for (auto& [pc, subroutine] : analysis->subroutines) {
+      renderSubroutine(cursor, subroutine);
+    }
+    cursor.endEditBlock();
   }
 
   if (lastClickedPC) {
@@ -57,6 +71,7 @@ void DisassemblyView::renderAnalysis(Analysis* analysis) {
   } else {
     moveCursor(QTextCursor::Start);
   }
+  highlightCurrentLine();
 }
 
 void DisassemblyView::jumpToLabel(Label label) {
@@ -108,34 +123,43 @@ optional<Label> DisassemblyView::getLabelFromPos(const QPoint pos) const {
   }
 }
 
-void DisassemblyView::setBlockState(BlockState state) {
-  textCursor().block().setUserState(state);
+void DisassemblyView::setBlockState(QTextCursor& cursor, BlockState state) {
+  cursor.block().setUserState(state);
+}
+
+void DisassemblyView::appendBlock(QTextCursor& cursor, const QString& text) {
+  if (!document()->isEmpty()) {
+    cursor.insertBlock();
+  }
+  cursor.insertText(text, defaultFormat);
 }
 
-void DisassemblyView::renderSubroutine(const Subroutine& subroutine) {
+void DisassemblyView::renderSubroutine(QTextCursor& cursor,
+                                       const Subroutine& subroutine) {
   auto label = subroutine.label;
-  append(qformat("%s:", label.c_str()));
+  appendBlock(cursor, qformat("%s:", label.c_str()));
 
-  auto block = textCursor().blockNumber();
+  auto block = cursor.blockNumber();
   blockToLabel[block] = label;
   labelToBlock[label.c_str()] = block;
   labelToPC[label.c_str()] = {subroutine.pc, subroutine.pc};
 
   if (subroutine.isEntryPoint) {
-    setBlockState(BlockState::EntryPointLabel);
+    setBlockState(cursor, BlockState::EntryPointLabel);
   }
 
   for (auto& [pc, instruction] : subroutine.instructions) {
-    renderInstruction(instruction);
+    renderInstruction(cursor, instruction);
   }
-  append("");
+  appendBlock(cursor, "");
 }
 
-void DisassemblyView::renderInstruction(Instruction* instruction) {
+void DisassemblyView::renderInstruction(QTextCursor& cursor,
+                                        Instruction* instruction) {
   PCPair pc = {instruction->pc, instruction->subroutinePC};
   if (auto label = instruction->label) {
-    append(qformat(".%s:", label->c_str()));
-    auto block = textCursor().blockNumber();
+    appendBlock(cursor, qformat(".%s:", label->c_str()));
+    auto block = cursor.blockNumber();
     auto combinedLabel = QString::fromStdString(label->combinedLabel());
     blockToLabel[block] = combinedLabel;
     labelToBlock[combinedLabel] = block;
@@ -143,10 +167,8 @@ void DisassemblyView::renderInstruction(Instruction* instruction) {
   }
 
   // Instruction name.
-  auto cursor = textCursor();
   auto format = defaultFormat;
-  cursor.insertText("\n  ");
-  cursor.insertText((instruction->name() + " ").c_str());
+  appendBlock(cursor, ("  " + instruction->name() + " ").c_str());
 
   // Instruction argument.
   if (auto argumentLabel = instruction->argumentLabel()) {
@@ -165,19 +187,19 @@ void DisassemblyView::renderInstruction(Instruction* instruction) {
 
   auto instructionStateChange = instruction->stateChange();
   if (instruction->assertion().has_value()) {
-    setBlockState(BlockState::AssertedStateChange);
+    setBlockState(cursor, BlockState::AssertedStateChange);
   } else if (instructionStateChange.has_value() &&
              instructionStateChange->unknown()) {
-    setBlockState(BlockState::UnknownStateChange);
+    setBlockState(cursor, BlockState::UnknownStateChange);
   } else if (auto jumpTable = instruction->jumpTable()) {
     if (jumpTable->status == JumpTableStatus::Complete) {
-      setBlockState(BlockState::CompleteJumpTable);
+      setBlockState(cursor, BlockState::CompleteJumpTable);
     } else {
-      setBlockState(BlockState::PartialJumpTable);
+      setBlockState(cursor, BlockState::PartialJumpTable);
     }
   }
 
-  auto block = textCursor().blockNumber();
+  auto block = cursor.blockNumber();
   blockToInstruction[block] = instruction;
   pcToBlock[pc] = block;
 }
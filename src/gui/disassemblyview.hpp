@@ -37,14 +37,15 @@ class DisassemblyView : public QTextEdit {
   MainWindow* mainWindow();
 
   void reset();
-  void setBlockState(BlockState state);
+  void setBlockState(QTextCursor& cursor, BlockState state);
+  void appendBlock(QTextCursor& cursor, const QString& text);
   Instruction* getInstructionFromPos(const QPoint pos) const;
   std::optional<Label> getLabelFromPos(const QPoint pos) const;
   void jumpToBlock(int block, int verticalOffset = 0);
   void jumpToPC(PCPair pc, int verticalOffset = 0);
 
-  void renderSubroutine(const Subroutine& subroutine);
-  void renderInstruction(Instruction* instruction);
+  void renderSubroutine(QTextCursor& cursor, const Subroutine& subroutine);
+  void renderInstruction(QTextCursor& cursor, Instruction* instruction);
   std::string instructionComment(const Instruction* instruction);
 
   void contextMenuEvent(QContextMenuEvent* e) override;
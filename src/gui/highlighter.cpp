@@ -45,13 +45,16 @@ void Highlighter::setupPatterns() {
   rule.format = argumentAliasFormat;
   rules.append(rule);
 
+  // A single alternation is matched in one pass over each block, instead of
+  // running a separate regular expression for every opcode.
   QStringList opcode_patterns;
   for (auto& op : OPCODE_NAMES) {
-    auto pattern = QString::fromStdString("\\b" + op + "\\b");
-    rule.pattern = QRegularExpression(pattern);
-    rule.format = opcodeFormat;
-    rules.append(rule);
+    opcode_patterns.append(QString::fromStdString(op));
   }
+  rule.pattern =
+      QRegularExpression("\\b(" + opcode_patterns.join('|') + ")\\b");
+  rule.format = opcodeFormat;
+  rules.append(rule);
 
   rule.pattern = QRegularExpression("^[A-Za-z0-9_]+:");
   rule.format = labelFormat;
@@ -5,9 +5,14 @@
 
 SubroutinesView::SubroutinesView(QWidget* parent) : QListWidget(parent) {
   setFont(QFont(MONOSPACE_FONT));
+  // All the items share the same font: lay out the list without measuring
+  // every single one of them.
+  setUniformItemSizes(true);
 }
 
 void SubroutinesView::renderAnalysis(const Analysis* analysis) {
+  // Repaint the list once it's fully populated, not after every item.
+  setUpdatesEnabled(false);
   clear();
   for (auto& [pc, subroutine] : analysis->subroutines) {
     auto item =
@@ -21,4 +26,5 @@ void SubroutinesView::renderAnalysis(const Analysis* analysis) {
 
     addItem(item);
   }
+  setUpdatesEnabled(true);
 }
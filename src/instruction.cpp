@@ -1,3 +1,5 @@
+#include <array>
+
 #include "instruction.hpp"
 
 #include "analysis.hpp"
@@ -6,41 +8,9 @@
 
 using namespace std;
 
-// Constructor.
-Instruction::Instruction(InstructionPC pc,
-                         SubroutinePC subroutinePC,
-                         u8 opcode,
-                         u24 argument,
-                         State state,
-                         Analysis* analysis)
-    : analysis{analysis},
-      pc{pc},
-      subroutinePC{subroutinePC},
-      opcode{opcode},
-      state{state},
-      _argument{argument} {}
-
-// Test constructor.
-Instruction::Instruction(u8 opcode) : opcode{opcode} {}
-
-// Name of the instruction's operation.
-string Instruction::name() const {
-  return OPCODE_NAMES[operation()];
-}
-
-// Instruction's operation.
-Op Instruction::operation() const {
-  return OPCODE_TABLE[opcode].first;
-}
-
-// Instruction'a address mode.
-AddressMode Instruction::addressMode() const {
-  return OPCODE_TABLE[opcode].second;
-}
-
-// Category of the instruction.
-InstructionType Instruction::type() const {
-  switch (operation()) {
+// Category of an operation.
+static InstructionType operationType(Op operation) {
+  switch (operation) {
     // Call instructions.
     case Op::JSR:
     case Op::JSL:
@@ -107,9 +77,8 @@ InstructionType Instruction::type() const {
   }
 }
 
-// Whether the instruction modifies A.
-bool Instruction::changesA() const {
-  auto op = operation();
+// Whether an operation modifies A.
+static bool operationChangesA(Op op) {
   return op == Op::ADC || op == Op::AND || op == Op::ASL || op == Op::DEC ||
          op == Op::EOR || op == Op::INC || op == Op::LDA || op == Op::LSR ||
          op == Op::ORA || op == Op::PLA || op == Op::ROL || op == Op::ROR ||
@@ -117,22 +86,20 @@ bool Instruction::changesA() const {
          op == Op::TYA || op == Op::XBA;
 }
 
-// Whether the instruction modifies X.
-bool Instruction::changesX() const {
-  auto op = operation();
+// Whether an operation modifies X.
+static bool operationChangesX(Op op) {
   return op == Op::DEX || op == Op::INX || op == Op::LDX || op == Op::PLX ||
          op == Op::TAX || op == Op::TSX || op == Op::TYX;
 }
 
-// Whether the instruction modifies the stack pointer.
-bool Instruction::changesStackPointer() const {
-  auto op = operation();
+// Whether an operation modifies the stack pointer.
+static bool operationChangesStackPointer(Op op) {
   return op == Op::TCS || op == Op::TXS;
 }
 
-// Whether this is a control instruction.
-bool Instruction::isControl() const {
-  switch (type()) {
+// Whether instructions of the given category are control instructions.
+static bool isControlType(InstructionType type) {
+  switch (type) {
     case InstructionType::Branch:
     case InstructionType::Call:
     case InstructionType::Jump:
@@ -143,6 +110,88 @@ bool Instruction::isControl() const {
       return false;
   }
 }
+
+// Properties of an opcode, derived from its operation.
+struct OpcodeProperties {
+  InstructionType type;      // Category of the instruction.
+  bool changesA;             // Whether the instruction modifies A.
+  bool changesX;             // Whether the instruction modifies X.
+  bool changesStackPointer;  // Whether it modifies the stack pointer.
+  bool isControl;            // Whether this is a control instruction.
+};
+
+// Properties of each opcode, indexed by opcode.
+static const auto OPCODE_PROPERTIES = [] {
+  array<OpcodeProperties, 256> properties;
+  for (size_t opcode = 0; opcode < properties.size(); opcode++) {
+    auto op = OPCODE_TABLE[opcode].first;
+    auto type = operationType(op);
+    properties[opcode] = {type, operationChangesA(op), operationChangesX(op),
+                          operationChangesStackPointer(op),
+                          isControlType(type)};
+  }
+  return properties;
+}();
+
+// Constructor.
+Instruction::Instruction(InstructionPC pc,
+                         SubroutinePC subroutinePC,
+                         u8 opcode,
+                         u24 argument,
+                         State state,
+                         Analysis* analysis)
+    : analysis{analysis},
+      pc{pc},
+      subroutinePC{subroutinePC},
+      opcode{opcode},
+      state{state},
+      _argument{argument},
+      _argumentSize{computeArgumentSize()} {}
+
+// Test constructor.
+Instruction::Instruction(u8 opcode)
+    : opcode{opcode}, _argumentSize{computeArgumentSize()} {}
+
+// Name of the instruction's operation.
+string Instruction::name() const {
+  return OPCODE_NAMES[operation()];
+}
+
+// Instruction's operation.
+Op Instruction::operation() const {
+  return OPCODE_TABLE[opcode].first;
+}
+
+// Instruction'a address mode.
+AddressMode Instruction::addressMode() const {
+  return OPCODE_TABLE[opcode].second;
+}
+
+// Category of the instruction.
+InstructionType Instruction::type() const {
+  return OPCODE_PROPERTIES[opcode].type;
+}
+
+// Whether the instruction modifies A.
+bool Instruction::changesA() const {
+  return OPCODE_PROPERTIES[opcode].changesA;
+}
+
+// Whether the instruction modifies X.
+bool Instruction::changesX() const {
+  return OPCODE_PROPERTIES[opcode].changesX;
+}
+
+// Whether the instruction modifies the stack pointer.
+bool Instruction::changesStackPointer() const {
+  return OPCODE_PROPERTIES[opcode].changesStackPointer;
+}
+
+// Whether this is a control instruction.
+bool Instruction::isControl() const {
+  return OPCODE_PROPERTIES[opcode].isControl;
+}
+
 // Whether this is a SEP/REP instruction.
 bool Instruction::isSepRep() const {
   return type() == InstructionType::SepRep;
@@ -155,6 +204,11 @@ size_t Instruction::size() const {
 
 // Instruction's argument size.
 size_t Instruction::argumentSize() const {
+  return _argumentSize;
+}
+
+// Compute the instruction's argument size from its address mode and state.
+size_t Instruction::computeArgumentSize() const {
   if (auto size = ARGUMENT_SIZES[addressMode()]) {
     return *size;
   }
@@ -245,7 +299,7 @@ string Instruction::argumentString(bool aliased) const {
   }
 
   auto arg = argument();
-  auto sz = argumentSize();
+  int sz = argumentSize();
 
   switch (addressMode()) {
     default:
@@ -256,7 +310,7 @@ string Instruction::argumentString(bool aliased) const {
     case ImmediateM:
     case ImmediateX:
     case Immediate8:
-      return format("#$%0" + to_string(sz * 2) + "X", *arg);
+      return format("#$%0*X", sz * 2, *arg);
 
     case Relative:
     case RelativeLong:
@@ -264,35 +318,35 @@ string Instruction::argumentString(bool aliased) const {
     case Absolute:
     case AbsoluteLong:
     case StackAbsolute:
-      return format("$%0" + to_string(sz * 2) + "X", *arg);
+      return format("$%0*X", sz * 2, *arg);
 
     case DirectPageIndexedX:
     case AbsoluteIndexedX:
     case AbsoluteIndexedLong:
-      return format("$%0" + to_string(sz * 2) + "X,x", *arg);
+      return format("$%0*X,x", sz * 2, *arg);
 
     case DirectPageIndexedY:
     case AbsoluteIndexedY:
-      return format("$%0" + to_string(sz * 2) + "X,y", *arg);
+      return format("$%0*X,y", sz * 2, *arg);
 
     case DirectPageIndirect:
     case AbsoluteIndirect:
     case PeiDirectPageIndirect:
-      return format("($%0" + to_string(sz * 2) + "X)", *arg);
+      return format("($%0*X)", sz * 2, *arg);
 
     case DirectPageIndirectLong:
     case AbsoluteIndirectLong:
-      return format("[$%0" + to_string(sz * 2) + "X]", *arg);
+      return format("[$%0*X]", sz * 2, *arg);
 
     case DirectPageIndexedIndirect:
     case AbsoluteIndexedIndirect:
-      return format("($%0" + to_string(sz * 2) + "X,x)", *arg);
+      return format("($%0*X,x)", sz * 2, *arg);
 
     case DirectPageIndirectIndexed:
-      return format("($%0" + to_string(sz * 2) + "X),y", *arg);
+      return format("($%0*X),y", sz * 2, *arg);
 
     case DirectPageIndirectIndexedLong:
-      return format("[$%0" + to_string(sz * 2) + "X],y", *arg);
+      return format("[$%0*X],y", sz * 2, *arg);
 
     case StackRelative:
       return format("$%02X,s", *arg);
@@ -92,7 +92,11 @@ class Instruction {
   std::optional<Label> label;  // Instruction's label, if any.
 
  private:
-  u24 _argument;  // Argument (if any).
+  // Compute the instruction's argument size from its address mode and state.
+  size_t computeArgumentSize() const;
+
+  u24 _argument;         // Argument (if any).
+  size_t _argumentSize;  // Argument size, fixed by the address mode and state.
 };
 // Set of Instructions.
 typedef std::unordered_set<Instruction, boost::hash<Instruction>>
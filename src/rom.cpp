@@ -1,3 +1,5 @@
+#include <algorithm>
+#include <cctype>
 #include <filesystem>
 
 #include "rom.hpp"
@@ -6,6 +8,15 @@
 
 using namespace std;
 
+// Contribution of each byte of a title to the ROM type score (0 if invalid).
+static const auto TITLE_BYTE_SCORES = [] {
+  array<int, 0x100> scores;
+  for (int c = 0; c < 0x100; c++) {
+    scores[c] = (c == 0x00) ? 1 : (isprint(c) ? 2 : 0);
+  }
+  return scores;
+}();
+
 // Construct an empty ROM (for test purposes).
 ROM::ROM() {}
 
@@ -13,7 +24,7 @@ ROM::ROM() {}
 ROM::ROM(const string& path) : path{path} {
   data = readBinaryFile(path);
   romType = discoverType();
-  romType = discoverSubtype();
+  mapBanks();
 };
 
 // Return the path of the save file containing the analysis of the ROM.
@@ -30,6 +41,11 @@ u8 ROM::readByte(u24 address) const {
 
 // Read a word (16 bits).
 u16 ROM::readWord(u24 address) const {
+  if ((address & 0x7FFF) + 2 <= 0x8000) {
+    auto pc = translate(address);
+    return (data[pc + 1] << 8) | data[pc];
+  }
+
   u8 lo = readByte(address);
   u8 hi = readByte(address + 1);
   return (hi << 8) | lo;
@@ -37,6 +53,11 @@ u16 ROM::readWord(u24 address) const {
 
 // Read an address (24 bits).
 u24 ROM::readAddress(u24 address) const {
+  if ((address & 0x7FFF) + 3 <= 0x8000) {
+    auto pc = translate(address);
+    return (data[pc + 2] << 16) | (data[pc + 1] << 8) | data[pc];
+  }
+
   u16 lo = readWord(address);
   u8 hi = readByte(address + 2);
   return (hi << 16) | lo;
@@ -44,13 +65,31 @@ u24 ROM::readAddress(u24 address) const {
 
 // Read a sequence of bytes.
 vector<u8> ROM::read(u24 address, size_t bytes) const {
-  vector<u8> buffer(bytes);
+  // Ranges inside a single 32KB page are contiguous in the file.
+  if ((address & 0x7FFF) + bytes <= 0x8000) {
+    auto begin = data.begin() + translate(address);
+    return vector<u8>(begin, begin + bytes);
+  }
+
+  vector<u8> buffer;
+  buffer.reserve(bytes);
   for (size_t i = 0; i < bytes; i++) {
     buffer.push_back(readByte(address + i));
   }
   return buffer;
 }
 
+// Read an opcode and the 24 bits that follow it.
+pair<u8, u24> ROM::readInstruction(u24 address) const {
+  if ((address & 0x7FFF) + 4 <= 0x8000) {
+    auto pc = translate(address);
+    return {data[pc],
+            (data[pc + 3] << 16) | (data[pc + 2] << 8) | data[pc + 1]};
+  }
+
+  return {readByte(address), readAddress(address + 1)};
+}
+
 // Return true if the address is in RAM, false otherwise.
 bool ROM::isRAM(u24 address) {
   return (address <= 0x001FFF) || (0x7E0000 <= address && address <= 0x7FFFFF);
@@ -68,15 +107,8 @@ size_t ROM::realSize() const {
 
 // Return the ROM's title.
 string ROM::title() const {
-  string title;
-  for (int i = 0; i < Header::TITLE_LEN; i++) {
-    char c = readByte(translateHeader(Header::TITLE + i));
-    if (c == 0x00) {
-      break;
-    }
-    title.push_back(c);
-  }
-  return title;
+  auto title = read(translateHeader(Header::TITLE), Header::TITLE_LEN);
+  return string(title.begin(), find(title.begin(), title.end(), 0x00));
 }
 
 // Return the reset vector (ROM's entry point).
@@ -91,6 +123,12 @@ SubroutinePC ROM::nmiVector() const {
 
 // Translate an address from SNES to PC.
 u24 ROM::translate(u24 address) const {
+  auto& bank = banks[(address >> 16) & 0xFF];
+  return bank.base | (address & bank.mask);
+}
+
+// Translate an address from SNES to PC, without the bank mappings.
+u24 ROM::translateUncached(u24 address) const {
   switch (romType) {
     case ROMType::LoROM:
       return ((address & 0x7F0000) >> 1) | (address & 0x7FFF);
@@ -123,6 +161,36 @@ u24 ROM::translate(u24 address) const {
   __builtin_unreachable();
 }
 
+// Compute the bank mappings for the current ROM type.
+void ROM::mapBanks() {
+  for (u24 bank = 0; bank < banks.size(); bank++) {
+    u24 address = bank << 16;
+
+    bool isLoROMBank;
+    switch (romType) {
+      case ROMType::LoROM:
+      case ROMType::ExLoROM:
+        isLoROMBank = true;
+        break;
+
+      case ROMType::HiROM:
+      case ROMType::ExHiROM:
+        isLoROMBank = false;
+        break;
+
+      case ROMType::SDD1:
+        isLoROMBank = address < 0xC00000;
+        break;
+
+      default:
+        __builtin_unreachable();
+    }
+
+    u24 mask = isLoROMBank ? 0x7FFF : 0xFFFF;
+    banks[bank] = {translateUncached(address), mask};
+  }
+}
+
 // Translate address inside the header.
 u24 ROM::translateHeader(u24 address) const {
   if (romType == ROMType::ExLoROM || romType == ROMType::SDD1) {
@@ -133,57 +201,45 @@ u24 ROM::translateHeader(u24 address) const {
 
 // Discover the ROM type.
 ROMType ROM::discoverType() const {
-  if (data.size() <= 0x8000) {
-    return ROMType::LoROM;
+  bool isLoROM = true;
+  if (data.size() > 0x8000) {
+    isLoROM = typeScore(ROMType::LoROM) >= typeScore(ROMType::HiROM);
   }
 
-  int lorom = typeScore(ROMType::LoROM);
-  int hirom = typeScore(ROMType::HiROM);
-
-  return (hirom > lorom) ? ROMType::HiROM : ROMType::LoROM;
-}
-
-// Discover the ROM subtype.
-ROMType ROM::discoverSubtype() const {
-  u8 markup = readByte(Header::MARKUP);
-
-  switch (romType) {
-    case ROMType::LoROM:
-      if (markup == 0x32) {
-        return ROMType::SDD1;
-      } else if (markup & (1 << 1)) {
-        return ROMType::ExLoROM;
-      }
-      break;
-
-    case ROMType::HiROM:
-      if (markup & (1 << 2)) {
-        return ROMType::ExHiROM;
-      }
-      break;
-
-    default:
-      break;
+  // Read the markup directly, the bank mappings don't exist yet.
+  if (isLoROM) {
+    u8 markup = data[headerOffset(ROMType::LoROM, Header::MARKUP)];
+    if (markup == 0x32) {
+      return ROMType::SDD1;
+    } else if (markup & (1 << 1)) {
+      return ROMType::ExLoROM;
+    }
+    return ROMType::LoROM;
+  } else {
+    u8 markup = data[headerOffset(ROMType::HiROM, Header::MARKUP)];
+    if (markup & (1 << 2)) {
+      return ROMType::ExHiROM;
+    }
+    return ROMType::HiROM;
   }
+}
 
-  return romType;
+// Offset of a header field inside the file, for a LoROM or HiROM layout.
+u24 ROM::headerOffset(ROMType romType, u24 address) {
+  return (romType == ROMType::LoROM) ? (address - 0x8000) : address;
 }
 
 // Estimate the likelihood that the the ROM is of the given type.
 int ROM::typeScore(ROMType romType) const {
-  u24 titleAddress =
-      (romType == ROMType::LoROM) ? (Header::TITLE - 0x8000) : Header::TITLE;
+  u24 titleAddress = headerOffset(romType, Header::TITLE);
 
   int score = 0;
   for (int i = 0; i < Header::TITLE_LEN; i++) {
-    char c = data[titleAddress + i];
-    if (c == 0x00) {
-      score += 1;
-    } else if (isprint(c)) {
-      score += 2;
-    } else {
+    int byteScore = TITLE_BYTE_SCORES[data[titleAddress + i]];
+    if (byteScore == 0) {
       return 0;
     }
+    score += byteScore;
   }
   return score;
 }
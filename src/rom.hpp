@@ -1,6 +1,8 @@
 #pragma once
 
+#include <array>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include "types.hpp"
@@ -25,6 +27,12 @@ enum Header {
   RESET = 0xFFFC,
 };
 
+// Mapping of a SNES bank to the ROM file.
+struct BankMapping {
+  u24 base = 0;  // Offset of the bank in the ROM file.
+  u24 mask = 0;  // Bits of the address that index inside the bank.
+};
+
 // Class representing a SNES ROM.
 class ROM {
  public:
@@ -41,6 +49,8 @@ class ROM {
   u24 readAddress(u24 address) const;  // Read an address (24 bits).
   // Read a sequence of bytes.
   std::vector<u8> read(u24 address, size_t bytes) const;
+  // Read an opcode and the 24 bits that follow it.
+  std::pair<u8, u24> readInstruction(u24 address) const;
 
   // Return true if the address is in RAM, false otherwise.
   static bool isRAM(u24 address);
@@ -71,12 +81,20 @@ class ROM {
   // Translate address inside the header.
   u24 translateHeader(u24 address) const;
 
+  // Translate an address from SNES to PC, without the bank mappings.
+  u24 translateUncached(u24 address) const;
+
+  // Compute the bank mappings for the current ROM type.
+  void mapBanks();
+
   // Discover the ROM type.
   ROMType discoverType() const;
 
-  // Discover the ROM subtype.
-  ROMType discoverSubtype() const;
+  // Offset of a header field inside the file, for a LoROM or HiROM layout.
+  static u24 headerOffset(ROMType romType, u24 address);
 
   // Estimate the likelihood that the the ROM is of the given type.
   int typeScore(ROMType romType) const;
+
+  std::array<BankMapping, 0x100> banks;  // Bank mappings, indexed by bank.
 };
@@ -1,8 +1,37 @@
 #include "stack.hpp"
+#include <algorithm>
 #include <variant>
 
 using namespace std;
 
+// Position of the first entry whose address is not above the given one.
+template <class Memory>
+static auto lowerBound(Memory& memory, u16 address) {
+  return lower_bound(
+      memory.begin(), memory.end(), address,
+      [](const auto& entry, u16 address) { return entry.first > address; });
+}
+
+// Find the entry at the given address, if it was ever written.
+const StackEntry* Stack::find(u16 address) const {
+  auto search = lowerBound(memory, address);
+  if (search != memory.end() && search->first == address) {
+    return &search->second;
+  } else {
+    return nullptr;
+  }
+}
+
+// Write an entry at the given address.
+void Stack::write(u16 address, StackEntry entry) {
+  auto search = lowerBound(memory, address);
+  if (search != memory.end() && search->first == address) {
+    search->second = entry;
+  } else {
+    memory.emplace(search, address, entry);
+  }
+}
+
 // Set a new stack pointer.
 void Stack::setPointer(u16 pointer, const Instruction* instruction) {
   this->pointer = pointer;
@@ -18,7 +47,7 @@ void Stack::pushValue(size_t size,
     if (data.has_value()) {
       stackData = (u8)((*data >> (i * 8)) & 0xFF);
     }
-    memory[pointer--] = {instruction, stackData};
+    write(pointer--, {instruction, stackData});
   }
 }
 
@@ -26,8 +55,7 @@ void Stack::pushValue(size_t size,
 void Stack::pushState(State state,
                       StateChange stateChange,
                       const Instruction* instruction) {
-  memory[pointer--] = {instruction,
-                       pair<State, StateChange>(state, stateChange)};
+  write(pointer--, {instruction, pair<State, StateChange>(state, stateChange)});
 }
 
 // Push a byte onto the stack.
@@ -63,9 +91,8 @@ vector<StackEntry> Stack::pop(size_t size) {
 
 // Pop an entry from the stack.
 StackEntry Stack::popOne() {
-  auto search = memory.find(++pointer);
-  if (search != memory.end()) {
-    return search->second;
+  if (auto entry = find(++pointer)) {
+    return *entry;
   } else {
     return StackEntry();
   }
@@ -75,9 +102,8 @@ StackEntry Stack::popOne() {
 vector<StackEntry> Stack::peek(size_t size) const {
   vector<StackEntry> result;
   for (size_t i = 1; i <= size; i++) {
-    auto search = memory.find(pointer + i);
-    if (search != memory.end()) {
-      result.push_back(search->second);
+    if (auto entry = find(pointer + i)) {
+      result.push_back(*entry);
     } else {
       result.push_back(StackEntry());
     }
@@ -87,14 +113,13 @@ vector<StackEntry> Stack::peek(size_t size) const {
 
 // Compare the value at the top of the stack with a given value.
 bool Stack::matchValue(size_t size, u24 value) const {
-  auto entries = peek(size);
-
   for (size_t i = 0; i < size; i++) {
-    auto data = entries[i].data;
-    if (!holds_alternative<u8>(data)) {
+    auto entry = find(pointer + i + 1);
+    if (entry == nullptr) {
       return false;
     }
-    if (get<u8>(data) != ((value >> (i * 8)) & 0xFF)) {
+    auto data = get_if<u8>(&entry->data);
+    if (data == nullptr || *data != ((value >> (i * 8)) & 0xFF)) {
       return false;
     }
   }
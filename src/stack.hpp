@@ -1,7 +1,6 @@
 #pragma once
 
 #include <optional>
-#include <unordered_map>
 #include <variant>
 #include <vector>
 
@@ -58,7 +57,14 @@ class Stack {
   u16 pointer = 0x100;  // Stack pointer.
 
  private:
-  std::unordered_map<u16, StackEntry> memory;  // SNES's RAM.
+  // Find the entry at the given address, if it was ever written.
+  const StackEntry* find(u16 address) const;
+  // Write an entry at the given address.
+  void write(u16 address, StackEntry entry);
+
+  // SNES's RAM, sorted by decreasing address (the stack grows downwards).
+  // Cheaper to copy than a hash table, which happens on every CPU fork.
+  std::vector<std::pair<u16, StackEntry>> memory;
   // The last instruction to explicitly change the stack pointer.
   const Instruction* lastManipulator = nullptr;
 };
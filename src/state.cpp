@@ -7,37 +7,10 @@ using namespace std;
  ***********/
 
 // Constructors.
-State::State() : State(false, false) {}
+State::State() : p{0} {}
 State::State(u8 p) : p{p} {}
-State::State(bool m, bool x) : p{0} {
-  this->m = m;
-  this->x = x;
-}
-
-// Size of A in bytes.
-std::size_t State::sizeA() const {
-  return m ? 1 : 2;
-}
-
-// Size of X in bytes.
-std::size_t State::sizeX() const {
-  return x ? 1 : 2;
-}
-
-// Set bits in P.
-void State::set(u8 mask) {
-  p |= mask;
-}
-
-// Reset bits in P.
-void State::reset(u8 mask) {
-  p &= ~mask;
-}
-
-// Comparison function.
-bool State::operator==(const State& other) const {
-  return p == other.p;
-}
+// M is bit 5 of P, X is bit 4.
+State::State(bool m, bool x) : p{(u8)((m << 5) | (x << 4))} {}
 
 /*****************
  *  StateChange  *
@@ -105,8 +78,9 @@ bool StateChange::operator==(const StateChange& other) const {
   return m == other.m && x == other.x;
 };
 std::size_t hash_value(const StateChange& stateChange) {
-  size_t seed = 0;
-  boost::hash_combine(seed, stateChange.m);
-  boost::hash_combine(seed, stateChange.x);
-  return seed;
+  // Each flag has three possible values: pack them into a small integer.
+  auto key = [](optional<bool> flag) -> size_t {
+    return flag.has_value() ? *flag : 2;
+  };
+  return key(stateChange.m) | (key(stateChange.x) << 2);
 }
@@ -1,9 +1,7 @@
 #pragma once
 
-#include <boost/container_hash/hash.hpp>
 #include <optional>
 #include <unordered_map>
-#include <unordered_set>
 
 #include "boost_serialization_std_optional.hpp"
 #include "types.hpp"
@@ -31,14 +29,15 @@ struct State {
   State(u8 p);
   State(bool m, bool x);
 
-  std::size_t sizeA() const;  // Size of A in bytes.
-  std::size_t sizeX() const;  // Size of X in bytes.
+  // These are queried for every decoded instruction: keep them inline.
+  std::size_t sizeA() const { return m ? 1 : 2; }  // Size of A in bytes.
+  std::size_t sizeX() const { return x ? 1 : 2; }  // Size of X in bytes.
 
-  void set(u8 mask);    // Set bits in P.
-  void reset(u8 mask);  // Reset bits in P.
+  void set(u8 mask) { p |= mask; }     // Set bits in P.
+  void reset(u8 mask) { p &= ~mask; }  // Reset bits in P.
 
   // Comparison function.
-  bool operator==(const State& other) const;
+  bool operator==(const State& other) const { return p == other.p; }
 
   template <class Archive>
   void serialize(Archive& ar, const unsigned int) {
@@ -98,6 +97,3 @@ struct StateChange {
 
 // Map from InstructionPC to StateChange.
 typedef std::unordered_map<InstructionPC, StateChange> StateChangeMap;
-// Set of StateChanges.
-typedef std::unordered_set<StateChange, boost::hash<StateChange>>
-    StateChangeSet;
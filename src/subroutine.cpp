@@ -10,7 +10,9 @@ Subroutine::Subroutine(SubroutinePC pc, std::string label, bool isEntryPoint)
 
 // Add an instruction.
 void Subroutine::addInstruction(Instruction* instruction) {
-  instructions[instruction->pc] = instruction;
+  // Execution mostly proceeds forward: hint insertion at the end of the map.
+  instructions.insert_or_assign(instructions.end(), instruction->pc,
+                                instruction);
 }
 
 // Add a state change.
@@ -55,15 +57,6 @@ bool Subroutine::savesStateInIncipit() const {
   return false;
 }
 
-// Return the state changes, simplified given the current state.
-StateChangeSet Subroutine::simplifiedStateChanges(State state) {
-  StateChangeSet stateChanges;
-  for (auto& [pc, stateChange] : knownStateChanges) {
-    stateChanges.insert(stateChange.simplify(state));
-  }
-  return stateChanges;
-}
-
 // Return the state change caused by an instruction at the given PC, if any.
 optional<StateChange> Subroutine::stateChangeForPC(InstructionPC pc) const {
   auto knownSearch = knownStateChanges.find(pc);
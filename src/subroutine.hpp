@@ -30,9 +30,6 @@ struct Subroutine {
   // Whether the subroutine saves the CPU state at the beginning.
   bool savesStateInIncipit() const;
 
-  // Return the state changes, simplified given the current state.
-  StateChangeSet simplifiedStateChanges(State state);
-
   // Return the state change caused by an instruction at the given PC, if any.
   std::optional<StateChange> stateChangeForPC(InstructionPC pc) const;
 
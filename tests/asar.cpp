@@ -1,5 +1,7 @@
+#include <algorithm>
 #include <cstdio>
 #include <cstdlib>
+#include <filesystem>
 #include <unordered_map>
 
 #include "asar.hpp"
@@ -17,8 +19,17 @@ const ROM* assemble(const string& name) {
   string sfcPath = "roms/" + name + ".sfc";
   string asmPath = "roms/" + name + ".asm";
   string command = "asar " + asmPath;
-  remove(sfcPath.c_str());
-  system(command.c_str());
+
+  // Only reassemble if the source, or the header every fixture includes,
+  // has changed since the last run.
+  error_code error;
+  auto sfcTime = filesystem::last_write_time(sfcPath, error);
+  auto asmTime = max(filesystem::last_write_time(asmPath),
+                     filesystem::last_write_time("roms/lorom.asm"));
+  if (error || sfcTime < asmTime) {
+    remove(sfcPath.c_str());
+    system(command.c_str());
+  }
 
   cache[name] = new ROM(sfcPath);
   return cache[name];
@@ -0,0 +1,11 @@
+incsrc lorom.asm
+
+org $8000
+reset:
+  jsr recursive                 ; $008000
+.loop:
+  jmp .loop                     ; $008003
+
+recursive:
+  jsr recursive                 ; $008006
+  rts                           ; $008009
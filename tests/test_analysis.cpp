@@ -16,14 +16,14 @@ TEST_CASE("Assertions work correctly", "[analysis]") {
   REQUIRE(analysis.subroutines.size() - 1 == 2);
 
   // Test there's a `reset` subroutine with the correct number of instructions.
-  auto& resetSubroutine = analysis.subroutines.at(0x8000);
+  auto resetSubroutine = analysis.subroutines.at(0x8000);
   REQUIRE(resetSubroutine.label == "reset");
   REQUIRE(resetSubroutine.instructions.size() == 1);
   // Test that the subroutine is unknown because it's calling an unknown sub.
   REQUIRE(resetSubroutine.isUnknownBecauseOf(UnknownReason::Unknown));
 
   // Check that there's an unknown subroutine with an indirect jump.
-  auto& unknownSubroutine = analysis.subroutines.at(0x8005);
+  auto unknownSubroutine = analysis.subroutines.at(0x8005);
   REQUIRE(unknownSubroutine.instructions.size() == 1);
   REQUIRE(unknownSubroutine.isUnknownBecauseOf(UnknownReason::IndirectJump));
 
@@ -256,3 +256,29 @@ TEST_CASE("Entry points can be added and analyzed", "[analysis]") {
   REQUIRE(loopSubroutine.label == "loop");
   REQUIRE(loopSubroutine.instructions.size() == 1);
 }
+
+TEST_CASE("Visited instructions are tracked by state", "[analysis]") {
+  Analysis analysis(*assemble("state_change"));
+  analysis.run();
+
+  // `reset` starts in 16-bits mode and switches to 8-bits.
+  REQUIRE(analysis.isVisited(0x8000, 0x8000, State()));
+  REQUIRE(!analysis.isVisited(0x8000, 0x8000, State(true, true)));
+  REQUIRE(analysis.isVisited(0x8002, 0x8000, State(true, true)));
+
+  // `state_change` is only ever called in 8-bits mode.
+  REQUIRE(analysis.isVisited(0x800E, 0x800E, State(true, true)));
+  REQUIRE(!analysis.isVisited(0x800E, 0x800E, State()));
+  REQUIRE(!analysis.isVisited(0x800E, 0x8000, State(true, true)));
+}
+
+TEST_CASE("Recursive calls are detected", "[analysis]") {
+  Analysis analysis(*assemble("recursion"));
+  analysis.run();
+
+  auto& recursiveSubroutine = analysis.subroutines.at(0x8006);
+  REQUIRE(recursiveSubroutine.isUnknownBecauseOf(UnknownReason::Recursion));
+
+  auto& resetSubroutine = analysis.subroutines.at(0x8000);
+  REQUIRE(resetSubroutine.isUnknownBecauseOf(UnknownReason::Unknown));
+}
@@ -101,6 +101,41 @@ TEST_CASE("ROM reads addresses (24-bits) correctly", "[rom]") {
   }
 }
 
+TEST_CASE("ROM reads sequences of bytes correctly", "[rom]") {
+  auto roms = {assemble("lorom"), assemble("hirom")};
+  for (auto rom : roms) {
+    auto bytes = rom->read(Header::TITLE, 5);
+    REQUIRE(bytes == std::vector<u8>{0x54, 0x45, 0x53, 0x54, 0x00});
+  }
+}
+
+TEST_CASE("ROM reads instructions correctly", "[rom]") {
+  auto roms = {assemble("lorom"), assemble("hirom")};
+  for (auto rom : roms) {
+    auto [opcode, argument] = rom->readInstruction(Header::TITLE);
+    REQUIRE(opcode == 0x54);
+    REQUIRE(argument == 0x545345);
+  }
+}
+
+TEST_CASE("ROM reads across 32KB pages correctly", "[rom]") {
+  // In LoROM, $007FFC-$007FFF is the end of the first page in the file,
+  // and $008000 is mirrored back to its beginning.
+  auto rom = assemble("lorom");
+
+  auto bytes = rom->read(0x7FFC, 6);
+  REQUIRE(bytes.size() == 6);
+  REQUIRE(bytes[0] == 0x00);
+  REQUIRE(bytes[1] == 0x80);
+  for (size_t i = 0; i < bytes.size(); i++) {
+    REQUIRE(bytes[i] == rom->readByte(0x7FFC + i));
+  }
+
+  auto [opcode, argument] = rom->readInstruction(0x7FFD);
+  REQUIRE(opcode == 0x80);
+  REQUIRE(argument == rom->readAddress(0x7FFE));
+}
+
 TEST_CASE("ROM's RESET vector is extracted correctly", "[rom]") {
   auto roms = {assemble("lorom"), assemble("hirom")};
   for (auto rom : roms) {
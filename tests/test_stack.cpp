@@ -55,3 +55,20 @@ TEST_CASE("Matching values on stack works correctly", "[stack]") {
   REQUIRE(!stack.matchValue(2, 0x1235));
   REQUIRE(!stack.matchValue(3, 0x123456));
 }
+
+TEST_CASE("Stack entries are overwritten by new pushes", "[stack]") {
+  Stack stack;
+  Instruction pha(0x48);
+  Instruction phx(0xDA);
+
+  stack.pushValue(2, 0x1234, &pha);
+  stack.popOne();
+  stack.pushOne(0x56, &phx);
+  auto entries = stack.peek(2);
+
+  REQUIRE(get<u8>(entries[0].data) == 0x56);
+  REQUIRE(entries[0].instruction == &phx);
+
+  REQUIRE(get<u8>(entries[1].data) == 0x12);
+  REQUIRE(entries[1].instruction == &pha);
+}